@@ -9,8 +9,8 @@ const __dirname = dirname(__filename);
 
 const serverPath = resolve(__dirname, '../src/lib/server.js');
 
-// Start the server
-const child = spawn('node', [serverPath], {
+// Start the server with the same Node binary running this script — no PATH lookup needed
+const child = spawn(process.execPath, [serverPath], {
     stdio: 'inherit'
 });
 
@@ -131,6 +131,13 @@ const locatorSchema = {
 };
 
 // Browser Management Tools
+// Browsers configured through Options.addArguments share one setup path; Safari takes no arguments
+const browserConfigs = {
+    chrome:  { Options: ChromeOptions,  headlessArg: '--headless=new', apply: (b, o) => b.setChromeOptions(o) },
+    edge:    { Options: EdgeOptions,    headlessArg: '--headless=new', apply: (b, o) => b.setEdgeOptions(o) },
+    firefox: { Options: FirefoxOptions, headlessArg: '--headless',     apply: (b, o) => b.setFirefoxOptions(o) }
+};
+
 server.registerTool(
     "start_browser",
     {
@@ -153,66 +160,31 @@ server.registerTool(
                 builder = builder.withCapabilities({ 'webSocketUrl': true, 'unhandledPromptBehavior': 'ignore' });
             }
 
-            switch (browser) {
-                case 'chrome': {
-                    const chromeOptions = new ChromeOptions();
-                    if (options.headless) {
-                        chromeOptions.addArguments('--headless=new');
-                    }
-                    if (options.arguments) {
-                        options.arguments.forEach(arg => chromeOptions.addArguments(arg));
-                    }
-                    driver = await builder
-                        .forBrowser('chrome')
-                        .setChromeOptions(chromeOptions)
-                        .build();
-                    break;
+            if (browser === 'safari') {
+                const safariOptions = new SafariOptions();
+                if (options.headless) {
+                    warnings.push('Safari does not support headless mode — launching with visible window.');
                 }
-                case 'edge': {
-                    const edgeOptions = new EdgeOptions();
-                    if (options.headless) {
-                        edgeOptions.addArguments('--headless=new');
-                    }
-                    if (options.arguments) {
-                        options.arguments.forEach(arg => edgeOptions.addArguments(arg));
-                    }
-                    driver = await builder
-                        .forBrowser('edge')
-                        .setEdgeOptions(edgeOptions)
-                        .build();
-                    break;
+                if (options.arguments?.length) {
+                    warnings.push('Safari does not support custom arguments — ignoring.');
                 }
-                case 'firefox': {
-                    const firefoxOptions = new FirefoxOptions();
-                    if (options.headless) {
-                        firefoxOptions.addArguments('--headless');
-                    }
-                    if (options.arguments) {
-                        options.arguments.forEach(arg => firefoxOptions.addArguments(arg));
-                    }
-                    driver = await builder
-                        .forBrowser('firefox')
-                        .setFirefoxOptions(firefoxOptions)
-                        .build();
-                    break;
+                driver = await builder
+                    .forBrowser('safari')
+                    .setSafariOptions(safariOptions)
+                    .build();
+            } else {
+                const config = browserConfigs[browser];
+                if (!config) {
+                    throw new Error(`Unsupported browser: ${browser}`);
                 }
-                case 'safari': {
-                    const safariOptions = new SafariOptions();
-                    if (options.headless) {
-                        warnings.push('Safari does not support headless mode — launching with visible window.');
-                    }
-                    if (options.arguments?.length) {
-                        warnings.push('Safari does not support custom arguments — ignoring.');
-                    }
-                    driver = await builder
-                        .forBrowser('safari')
-                        .setSafariOptions(safariOptions)
-                        .build();
-                    break;
+                const browserOptions = new config.Options();
+                if (options.headless) {
+                    browserOptions.addArguments(config.headlessArg);
                 }
-                default: {
-                    throw new Error(`Unsupported browser: ${browser}`);
+                if (options.arguments) {
+                    options.arguments.forEach(arg => browserOptions.addArguments(arg));
                 }
+                driver = await config.apply(builder.forBrowser(browser), browserOptions).build();
             }
             const sessionId = `${browser}_${Date.now()}`;
             state.drivers.set(sessionId, driver);
@@ -891,13 +863,14 @@ server.registerResource(
 
 // Cleanup handler
 async function cleanup() {
-    for (const [sessionId, driver] of state.drivers) {
+    // Sessions are independent, so quit them concurrently rather than one by one
+    await Promise.all([...state.drivers].map(async ([sessionId, driver]) => {
         try {
             await driver.quit();
         } catch (e) {
             console.error(`Error closing browser session ${sessionId}:`, e);
         }
-    }
+    }));
     state.drivers.clear();
     state.bidi.clear();
     state.currentSession = null;
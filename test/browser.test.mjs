@@ -5,7 +5,7 @@
 
 import { describe, it, before, after } from 'node:test';
 import assert from 'node:assert/strict';
-import { McpClient, getResponseText, fixture } from './mcp-client.mjs';
+import { McpClient, getResponseText, fixture, HEADLESS_CHROME } from './mcp-client.mjs';
 
 describe('Browser Management', () => {
   let client;
@@ -26,10 +26,7 @@ describe('Browser Management', () => {
     });
 
     it('should start a headless Chrome session', async () => {
-      const result = await client.callTool('start_browser', {
-        browser: 'chrome',
-        options: { headless: true, arguments: ['--no-sandbox', '--disable-dev-shm-usage'] },
-      });
+      const result = await client.callTool('start_browser', HEADLESS_CHROME);
       const text = getResponseText(result);
       assert.ok(text.includes('Browser started'), `Expected "Browser started", got: ${text}`);
       assert.ok(text.includes('session_id:'), `Expected session_id in response, got: ${text}`);
@@ -38,10 +35,7 @@ describe('Browser Management', () => {
 
   describe('close_session', () => {
     it('should close an active session', async () => {
-      await client.callTool('start_browser', {
-        browser: 'chrome',
-        options: { headless: true, arguments: ['--no-sandbox'] },
-      });
+      await client.callTool('start_browser', HEADLESS_CHROME);
 
       const result = await client.callTool('close_session');
       const text = getResponseText(result);
@@ -61,10 +55,7 @@ describe('Browser Management', () => {
 
   describe('take_screenshot', () => {
     before(async () => {
-      await client.callTool('start_browser', {
-        browser: 'chrome',
-        options: { headless: true, arguments: ['--no-sandbox'] },
-      });
+      await client.callTool('start_browser', HEADLESS_CHROME);
       await client.callTool('navigate', { url: fixture('locators.html') });
     });
 
@@ -85,10 +76,7 @@ describe('Browser Management', () => {
   describe('multi-session', () => {
     it('should start a second session (replaces current)', async () => {
       // Start first session
-      const first = await client.callTool('start_browser', {
-        browser: 'chrome',
-        options: { headless: true, arguments: ['--no-sandbox'] },
-      });
+      const first = await client.callTool('start_browser', HEADLESS_CHROME);
       const firstText = getResponseText(first);
       const firstId = firstText.match(/session_id: (\S+)/)?.[1];
       assert.ok(firstId, `Expected session_id, got: ${firstText}`);
@@ -97,10 +85,7 @@ describe('Browser Management', () => {
       await client.callTool('navigate', { url: fixture('locators.html') });
 
       // Start second session — this should become the active one
-      const second = await client.callTool('start_browser', {
-        browser: 'chrome',
-        options: { headless: true, arguments: ['--no-sandbox'] },
-      });
+      const second = await client.callTool('start_browser', HEADLESS_CHROME);
       const secondText = getResponseText(second);
       const secondId = secondText.match(/session_id: (\S+)/)?.[1];
       assert.ok(secondId, `Expected session_id, got: ${secondText}`);
@@ -11,7 +11,7 @@ import http from 'node:http';
 import fs from 'node:fs';
 import path from 'node:path';
 import { fileURLToPath } from 'node:url';
-import { McpClient, getResponseText } from './mcp-client.mjs';
+import { McpClient, getResponseText, HEADLESS_CHROME } from './mcp-client.mjs';
 
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 
@@ -42,16 +42,15 @@ describe('Cookie Management', () => {
 
     client = new McpClient();
     await client.start();
-    await client.callTool('start_browser', {
-      browser: 'chrome',
-      options: { headless: true, arguments: ['--no-sandbox', '--disable-dev-shm-usage'] },
-    });
+    await client.callTool('start_browser', HEADLESS_CHROME);
     await client.callTool('navigate', { url: baseUrl });
   });
 
   after(async () => {
     try { await client.callTool('close_session'); } catch { /* ignore */ }
     await client.stop();
+    // close() waits for open sockets; drop any idle keep-alive connections so it resolves promptly
+    httpServer.closeAllConnections();
     await new Promise((resolve) => httpServer.close(resolve));
   });
 
@@ -7,7 +7,7 @@
 
 import { describe, it, before, after } from 'node:test';
 import assert from 'node:assert/strict';
-import { McpClient, getResponseText, fixture } from './mcp-client.mjs';
+import { McpClient, getResponseText, fixture, HEADLESS_CHROME } from './mcp-client.mjs';
 import { fileURLToPath } from 'url';
 import { dirname, join } from 'path';
 
@@ -20,10 +20,7 @@ describe('Element Interactions', () => {
   before(async () => {
     client = new McpClient();
     await client.start();
-    await client.callTool('start_browser', {
-      browser: 'chrome',
-      options: { headless: true, arguments: ['--no-sandbox', '--disable-dev-shm-usage'] },
-    });
+    await client.callTool('start_browser', HEADLESS_CHROME);
   });
 
   after(async () => {
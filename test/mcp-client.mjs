@@ -22,33 +22,29 @@ export class McpClient {
    * Start the MCP server and initialize the connection.
    */
   async start() {
-    this.#process = spawn('node', [SERVER_PATH], {
-      stdio: ['pipe', 'pipe', 'pipe'],
+    // Server stderr is only surfaced when debugging; otherwise don't pipe it at all
+    this.#process = spawn(process.execPath, [SERVER_PATH], {
+      stdio: ['pipe', 'pipe', process.env.MCP_DEBUG ? 'pipe' : 'ignore'],
     });
 
+    // Decode as a stream so multi-byte characters split across chunks survive.
+    this.#process.stdout.setEncoding('utf8');
     this.#process.stdout.on('data', (chunk) => {
-      this.#buffer += chunk.toString();
-      const lines = this.#buffer.split('\n');
-      this.#buffer = lines.pop();
-      for (const line of lines) {
-        if (!line.trim()) continue;
-        try {
-          const msg = JSON.parse(line);
-          if (msg.id !== undefined && this.#pending.has(msg.id)) {
-            this.#pending.get(msg.id).resolve(msg);
-            this.#pending.delete(msg.id);
-          }
-        } catch {
-          // not JSON, ignore
-        }
+      // Only the new chunk can complete a line, so scan it rather than
+      // re-splitting the whole buffer — large responses (screenshots) arrive
+      // in many chunks and would otherwise be rescanned on every one.
+      let start = 0;
+      let newline;
+      while ((newline = chunk.indexOf('\n', start)) !== -1) {
+        this.#handleLine(this.#buffer + chunk.slice(start, newline));
+        this.#buffer = '';
+        start = newline + 1;
       }
+      this.#buffer += chunk.slice(start);
     });
 
-    this.#process.stderr.on('data', (chunk) => {
-      // Suppress server stderr unless debugging
-      if (process.env.MCP_DEBUG) {
-        process.stderr.write(`[server] ${chunk}`);
-      }
+    this.#process.stderr?.on('data', (chunk) => {
+      process.stderr.write(`[server] ${chunk}`);
     });
 
     this.#process.on('close', (code) => {
@@ -140,6 +136,19 @@ export class McpClient {
     }
   }
 
+  #handleLine(line) {
+    if (!line.trim()) return;
+    try {
+      const msg = JSON.parse(line);
+      if (msg.id !== undefined && this.#pending.has(msg.id)) {
+        this.#pending.get(msg.id).resolve(msg);
+        this.#pending.delete(msg.id);
+      }
+    } catch {
+      // not JSON, ignore
+    }
+  }
+
   #sendRequest(method, params = {}) {
     return new Promise((resolve, reject) => {
       const id = ++this.#requestId;
@@ -171,6 +180,14 @@ export function getResponseText(result) {
   return result?.content?.[0]?.text ?? '';
 }
 
+/**
+ * start_browser arguments for the headless Chrome session every suite runs against.
+ */
+export const HEADLESS_CHROME = {
+  browser: 'chrome',
+  options: { headless: true, arguments: ['--no-sandbox', '--disable-dev-shm-usage'] },
+};
+
 /**
  * Returns a file:// URL for a fixture HTML file.
  */
@@ -5,7 +5,7 @@
 
 import { describe, it, before, after } from 'node:test';
 import assert from 'node:assert/strict';
-import { McpClient, getResponseText, fixture } from './mcp-client.mjs';
+import { McpClient, getResponseText, fixture, HEADLESS_CHROME } from './mcp-client.mjs';
 
 describe('Navigation & Element Locators', () => {
   let client;
@@ -13,10 +13,7 @@ describe('Navigation & Element Locators', () => {
   before(async () => {
     client = new McpClient();
     await client.start();
-    await client.callTool('start_browser', {
-      browser: 'chrome',
-      options: { headless: true, arguments: ['--no-sandbox', '--disable-dev-shm-usage'] },
-    });
+    await client.callTool('start_browser', HEADLESS_CHROME);
   });
 
   after(async () => {
@@ -5,7 +5,7 @@
 
 import { describe, it, before, after } from 'node:test';
 import assert from 'node:assert/strict';
-import { McpClient, fixture } from './mcp-client.mjs';
+import { McpClient, fixture, HEADLESS_CHROME } from './mcp-client.mjs';
 
 describe('Resources', () => {
   let client;
@@ -13,10 +13,7 @@ describe('Resources', () => {
   before(async () => {
     client = new McpClient();
     await client.start();
-    await client.callTool('start_browser', {
-      browser: 'chrome',
-      options: { headless: true, arguments: ['--no-sandbox', '--disable-dev-shm-usage'] },
-    });
+    await client.callTool('start_browser', HEADLESS_CHROME);
     await client.callTool('navigate', { url: fixture('locators.html') });
   });
 
@@ -30,19 +27,19 @@ describe('Resources', () => {
       const result = await client.readResource('accessibility://current');
       assert.equal(result.contents[0].mimeType, 'application/json');
       const tree = JSON.parse(result.contents[0].text);
+      const { byRole, ids } = indexNodes(tree);
 
-      const headings = findNodes(tree, (n) => n.role === 'heading');
+      const headings = byRole.get('heading') ?? [];
       assert.ok(headings.length > 0, 'Should find at least one heading');
       assert.equal(headings[0].level, 1, 'H1 should have level 1');
 
-      const buttons = findNodes(tree, (n) => n.role === 'button');
-      const links = findNodes(tree, (n) => n.role === 'link');
-      const textboxes = findNodes(tree, (n) => n.role === 'textbox');
+      const buttons = byRole.get('button') ?? [];
+      const links = byRole.get('link') ?? [];
+      const textboxes = byRole.get('textbox') ?? [];
       assert.ok(buttons.length > 0, 'Should find at least one button');
       assert.ok(links.length > 0, 'Should find at least one link');
       assert.ok(textboxes.length > 0, 'Should find at least one textbox');
 
-      const ids = findNodes(tree, (n) => n.id).map((n) => n.id);
       assert.ok(ids.includes('title'), 'Should include #title');
       assert.ok(ids.includes('btn'), 'Should include #btn');
       assert.ok(ids.includes('input'), 'Should include #input');
@@ -78,15 +75,19 @@ describe('Resources', () => {
   });
 });
 
-/** Recursively find nodes matching a predicate. */
-function findNodes(node, predicate) {
-  if (!node) return [];
-  const results = [];
-  if (predicate(node)) results.push(node);
+/** Walk the tree once, grouping nodes by role and collecting IDs in document order. */
+function indexNodes(node, index = { byRole: new Map(), ids: [] }) {
+  if (!node) return index;
+  if (node.role) {
+    // Map, not a plain object: role comes from page markup and may be e.g. "constructor"
+    if (!index.byRole.has(node.role)) index.byRole.set(node.role, []);
+    index.byRole.get(node.role).push(node);
+  }
+  if (node.id) index.ids.push(node.id);
   if (node.children) {
     for (const child of node.children) {
-      results.push(...findNodes(child, predicate));
+      indexNodes(child, index);
     }
   }
-  return results;
+  return index;
 }
@@ -8,7 +8,7 @@
 
 import { describe, it, before, after } from 'node:test';
 import assert from 'node:assert/strict';
-import { McpClient, getResponseText, fixture } from './mcp-client.mjs';
+import { McpClient, getResponseText, fixture, HEADLESS_CHROME } from './mcp-client.mjs';
 
 describe('tools', () => {
   let client;
@@ -16,10 +16,7 @@ describe('tools', () => {
   before(async () => {
     client = new McpClient();
     await client.start();
-    await client.callTool('start_browser', {
-      browser: 'chrome',
-      options: { headless: true, arguments: ['--no-sandbox', '--disable-dev-shm-usage'] },
-    });
+    await client.callTool('start_browser', HEADLESS_CHROME);
   });
 
   after(async () => {
@@ -114,14 +111,13 @@ describe('tools', () => {
 
   describe('window management', () => {
     before(async () => {
-      // Close any extra windows left by previous tests, keeping only one
-      let result = await client.callTool('window', { action: 'list' });
-      let data = JSON.parse(getResponseText(result));
-      while (data.all.length > 1) {
-        await client.callTool('window', { action: 'switch', handle: data.all[data.all.length - 1] });
+      // Close any extra windows left by previous tests, keeping only the first.
+      // One list up front is enough: close always switches back to all[0].
+      const result = await client.callTool('window', { action: 'list' });
+      const data = JSON.parse(getResponseText(result));
+      for (const handle of data.all.slice(1)) {
+        await client.callTool('window', { action: 'switch', handle });
         await client.callTool('window', { action: 'close' });
-        result = await client.callTool('window', { action: 'list' });
-        data = JSON.parse(getResponseText(result));
       }
       await client.callTool('navigate', { url: fixture('windows.html') });
     });